@@ -1,16 +1,18 @@
 # Import required FastAPI components for building the API
 from fastapi import FastAPI, HTTPException
-from fastapi.responses import StreamingResponse
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 # Import Pydantic for data validation and settings management
 from pydantic import BaseModel
-# Import OpenAI client for interacting with OpenAI's API
-from openai import OpenAI
+# Import the async OpenAI client for interacting with OpenAI's API
+from openai import AsyncOpenAI
 import os
+from collections import OrderedDict
 from typing import Optional
 
 # Initialize FastAPI application with a title
-app = FastAPI(title="OpenAI Chat API")
+# JSON responses are serialized with orjson instead of the stdlib json encoder
+app = FastAPI(title="OpenAI Chat API", default_response_class=ORJSONResponse)
 
 # Configure CORS (Cross-Origin Resource Sharing) middleware
 # This allows the API to be accessed from different domains/origins
@@ -30,29 +32,55 @@ class ChatRequest(BaseModel):
     model: Optional[str] = "gpt-4.1-nano"  # Optional model selection with default
     api_key: str          # OpenAI API key for authentication
 
+# Cache of OpenAI clients keyed by API key
+# Reusing a client keeps its pooled keep-alive connections, so later requests
+# skip the TCP/TLS handshake instead of paying it on every call
+# The cache is an LRU capped at MAX_CLIENTS so memory stays bounded as new keys arrive
+MAX_CLIENTS = int(os.getenv("MAX_CLIENTS", 128))
+_client_cache: "OrderedDict[str, AsyncOpenAI]" = OrderedDict()
+
+def _get_client(api_key: str) -> AsyncOpenAI:
+    # No await happens between the lookup and the insert, so this is safe to
+    # call from concurrent requests on the same event loop
+    client = _client_cache.get(api_key)
+    if client is None:
+        client = AsyncOpenAI(api_key=api_key)
+        _client_cache[api_key] = client
+        # Drop the least recently used client; a stream still using it keeps
+        # its own reference, so it is only released once that stream ends
+        if len(_client_cache) > MAX_CLIENTS:
+            _client_cache.popitem(last=False)
+    else:
+        _client_cache.move_to_end(api_key)
+    return client
+
 # Define the main chat endpoint that handles POST requests
 @app.post("/api/chat")
 async def chat(request: ChatRequest):
     try:
-        # Initialize OpenAI client with the provided API key
-        client = OpenAI(api_key=request.api_key)
+        # Get a (cached) OpenAI client for the provided API key
+        client = _get_client(request.api_key)
+        
+        # Create a streaming chat completion request before the response starts,
+        # so errors (e.g. an invalid API key) are returned as a 500 JSON error
+        # instead of a stream that is cut off partway through
+        stream = await client.chat.completions.create(
+            model=request.model,
+            messages=[
+                {"role": "developer", "content": request.developer_message},
+                {"role": "user", "content": request.user_message}
+            ],
+            stream=True  # Enable streaming response
+        )
         
         # Create an async generator function for streaming responses
         async def generate():
-            # Create a streaming chat completion request
-            stream = client.chat.completions.create(
-                model=request.model,
-                messages=[
-                    {"role": "developer", "content": request.developer_message},
-                    {"role": "user", "content": request.user_message}
-                ],
-                stream=True  # Enable streaming response
-            )
-            
             # Yield each chunk of the response as it becomes available
-            for chunk in stream:
-                if chunk.choices[0].delta.content is not None:
-                    yield chunk.choices[0].delta.content
+            # Chunks are yielded as UTF-8 bytes so StreamingResponse sends them as-is
+            async for chunk in stream:
+                content = chunk.choices[0].delta.content
+                if content is not None:
+                    yield content.encode("utf-8")
 
         # Return a streaming response to the client with proper headers
         return StreamingResponse(